@@ -1,17 +1,25 @@
 from enum import Enum
 from fastapi import APIRouter, HTTPException
 from app.services.codeforces import fetch_last_submissions
+from app.core.cache import UPSTREAM_TIMEOUT, get_or_refresh_json
 import requests, re
 
 app = APIRouter()
 
-def getContestId(contest_number : int):
+# The contest list changes rarely; share it between workers for an hour
+CONTEST_LIST_TTL = 3600
+
+def fetchContestList():
     url = "https://codeforces.com/api/contest.list?gym=false"
-    response = requests.get(url)
+    response = requests.get(url, timeout=UPSTREAM_TIMEOUT)
     data = response.json()
 
     if data["status"] != "OK":
         raise Exception("Error fetching contests")
+    return data
+
+def getContestId(contest_number : int):
+    data = get_or_refresh_json("cf:contest.list", CONTEST_LIST_TTL, fetchContestList)
 
     for contest in data["result"]:
         name = contest["name"]
@@ -1,12 +1,14 @@
 from typing import Optional
 from enum import Enum
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from app.services.codeforces import fetch_last_submissions
-from app.schemas.mistakes import MistakeBase, MistakeCreate, MistakeResponse
+from app.schemas.mistakes import MistakeBase, MistakeCreate, MistakeResponse, MistakeSummaryResponse
 from app.models.mistake import Mistake # your SQLAlchemy model
 from app.database import get_db
+from app.services import mistakes as mistake_service
 from .. import crud
 from ..crud import mistakes as crud
 from .. import schemas
@@ -71,6 +73,7 @@ def post_mistake(mistake: MistakeCreate, db: Session = Depends(get_db)):
                 handle=mistake.handle,
             )
             db.add(db_mistake)
+            crud.add_to_summary(db, [mistake.dict()])
             db.commit()
             db.refresh(db_mistake)
             return {"message" : "Success"}
@@ -83,6 +86,17 @@ def get_mistakes_by_handle(handle: str, db: Session = Depends(get_db)):
     mistakes = crud.get_mistakes_by_handle(db, handle)
     return mistakes
 
+# ✅ Dashboard summary from the per-handle rollup table
+@router.get("/summary/{handle}", response_model=MistakeSummaryResponse)
+def get_mistake_summary(handle: str, db: Session = Depends(get_db)):
+    summary = {"handle": handle, "total": 0, "verdict": {}, "tag": {}, "rating": {}}
+    for row in crud.get_summary(db, handle):
+        if row.dimension == "total":
+            summary["total"] = row.count
+        else:
+            summary[row.dimension][row.bucket] = row.count
+    return summary
+
 # ✅ Fetch mistakes by problem name
 @router.get("/mistakes/problem/{problem_name}", response_model=list[MistakeBase])
 def get_mistakes_by_problem_name(problem_name: str, db: Session = Depends(get_db)):
@@ -175,3 +189,65 @@ def get_mistakes_in_range(handle: str, A: int, B: int):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+# ✅ Bulk export / import formats
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+EXPORTERS = {
+    ExportFormat.NDJSON: mistake_service.export_ndjson,
+    ExportFormat.CSV: mistake_service.export_csv,
+    ExportFormat.PARQUET: mistake_service.export_parquet,
+}
+
+@router.get("/export")
+def export_mistakes(
+    handle: Optional[str] = None,
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+):
+    """
+    Stream stored mistakes (optionally for one handle) as NDJSON, CSV or Parquet.
+    Rows are fetched in batches from a server-side cursor, never all at once.
+    """
+    if format == ExportFormat.PARQUET and not mistake_service.parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet support requires pyarrow")
+
+    filename = f"mistakes_{handle or 'all'}.{format.value}"
+    return StreamingResponse(
+        EXPORTERS[format](handle),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.post("/import")
+def import_mistakes(
+    file: UploadFile = File(...),
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    db: Session = Depends(get_db),
+):
+    """
+    Import mistakes from a file produced by /mistakes/export.
+    Rows matching an existing (handle, problem_name, verdict) only update
+    the message, so re-running an import is safe.
+    """
+    if format == ExportFormat.PARQUET and not mistake_service.parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet support requires pyarrow")
+
+    try:
+        imported, updated = mistake_service.import_mistakes(db, file.file, format.value)
+    except (ValueError, KeyError, TypeError) as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Invalid import file: {e}")
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {"message": "Success", "imported": imported, "updated": updated}
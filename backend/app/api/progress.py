@@ -0,0 +1,31 @@
+from enum import Enum
+from fastapi import APIRouter, HTTPException, Query
+from app.services.codeforces import fetch_all_submissions, fetch_rating_history
+from app.services.progress import build_progress
+
+router = APIRouter()
+
+class PeriodEnum(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+@router.get("/{handle}")
+def get_progress(
+    handle: str,
+    period: PeriodEnum = PeriodEnum.WEEK,
+    points: int = Query(120, ge=1, le=1000),
+):
+    """
+    Rating and practice time-series over the handle's full history:
+    attempts, AC rate, mistakes by verdict and average problem rating
+    per period, downsampled to at most `points` entries.
+    """
+    try:
+        submissions = fetch_all_submissions(handle)["result"]
+        rating_changes = fetch_rating_history(handle)["result"]
+        series = build_progress(submissions, rating_changes, period.value, points)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {"handle": handle, "period": period.value, "points": series}
@@ -0,0 +1,35 @@
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.crud import mistakes as crud
+from app.services.recommend import InvalidRatingBand, recommend
+
+router = APIRouter()
+
+@router.get("/{handle}")
+def get_recommendations(
+    handle: str,
+    count: int = Query(10, ge=1, le=50),
+    min_rating: Optional[int] = None,
+    max_rating: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Recommend unsolved problems for the handle's weakest tags, scored from
+    stored mistakes and recent failures, within the handle's rating band.
+    """
+    if min_rating is not None and max_rating is not None and min_rating > max_rating:
+        raise HTTPException(status_code=400, detail="min_rating must not exceed max_rating")
+
+    try:
+        stored_tag_counts = {
+            row.bucket: row.count
+            for row in crud.get_summary(db, handle)
+            if row.dimension == "tag"
+        }
+        return recommend(handle, stored_tag_counts, count, min_rating, max_rating)
+    except InvalidRatingBand as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,26 @@
+"""
+Backfill the mistake_summaries rollup table from the mistakes table.
+
+Usage (from backend/):
+    python -m app.commands.rebuild_mistake_summary [--handle HANDLE]
+"""
+import argparse
+from app.database import SessionLocal, engine
+from app.crud.mistakes import rebuild_summary
+from app.models.mistake_summary import MistakeSummary
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--handle", help="only rebuild this handle's summary")
+    args = parser.parse_args()
+
+    MistakeSummary.__table__.create(bind=engine, checkfirst=True)
+    db = SessionLocal()
+    try:
+        counted = rebuild_summary(db, args.handle)
+    finally:
+        db.close()
+    print(f"✅ Rebuilt mistake summary from {counted} mistakes.")
+
+if __name__ == "__main__":
+    main()
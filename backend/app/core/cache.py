@@ -0,0 +1,232 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# redis://host:6379/0, sqlite:///path/to/cache.db or memory://
+CACHE_URL = os.getenv(
+    "CACHE_URL",
+    "sqlite:///" + os.path.join(tempfile.gettempdir(), "algotracker_cache.sqlite3"),
+)
+
+LOCK_TIMEOUT = 30        # seconds before a held lock is considered abandoned
+UPSTREAM_TIMEOUT = 10    # seconds per upstream request; must stay below LOCK_TIMEOUT
+LOCK_WAIT = 35           # seconds a worker waits for another worker's refresh
+LOCK_POLL_INTERVAL = 0.05
+
+
+class CacheLockTimeout(Exception):
+    pass
+
+
+class CacheBackend(ABC):
+    """
+    Minimal Redis-style interface shared by every backend:
+    get / set with a TTL / delete, plus a cross-process lock.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def lock(self, key: str, timeout: int = LOCK_TIMEOUT, wait: float = LOCK_WAIT):
+        ...
+
+
+class RedisCache(CacheBackend):
+    """Shared cache for multi-host deployments (any Redis-compatible server)."""
+
+    def __init__(self, url: str):
+        import redis  # optional dependency, only needed for redis:// URLs
+
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        return self.client.get(key)
+
+    def set(self, key, value, ttl):
+        self.client.set(key, value, ex=ttl)
+
+    def delete(self, key):
+        self.client.delete(key)
+
+    @contextmanager
+    def lock(self, key, timeout=LOCK_TIMEOUT, wait=LOCK_WAIT):
+        lock = self.client.lock(f"lock:{key}", timeout=timeout, blocking_timeout=wait)
+        if not lock.acquire():
+            raise CacheLockTimeout(key)
+        try:
+            yield
+        finally:
+            try:
+                lock.release()
+            except Exception:
+                pass  # lock expired while held; another worker may own it now
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Shared cache for single-host deployments: every worker process opens
+    the same SQLite file, and locks are rows claimed with INSERT OR IGNORE.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS locks ("
+                "key TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        # A connection per call keeps the backend safe across threadpool workers
+        conn = sqlite3.connect(self.path, timeout=LOCK_WAIT, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, value, ttl):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+            conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+    def delete(self, key):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def _try_acquire(self, conn, key, token, timeout):
+        now = time.time()
+        conn.execute("DELETE FROM locks WHERE key = ? AND expires_at <= ?", (key, now))
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO locks (key, token, expires_at) VALUES (?, ?, ?)",
+            (key, token, now + timeout),
+        )
+        return cursor.rowcount == 1
+
+    @contextmanager
+    def lock(self, key, timeout=LOCK_TIMEOUT, wait=LOCK_WAIT):
+        token = uuid.uuid4().hex
+        deadline = time.time() + wait
+        with self._connect() as conn:
+            while not self._try_acquire(conn, key, token, timeout):
+                if time.time() >= deadline:
+                    raise CacheLockTimeout(key)
+                time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM locks WHERE key = ? AND token = ?", (key, token))
+
+
+class MemoryCache(CacheBackend):
+    """In-process cache for tests; not shared between workers."""
+
+    def __init__(self):
+        self._data = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def set(self, key, value, ttl):
+        self._data[key] = (value, time.time() + ttl)
+
+    def delete(self, key):
+        self._data.pop(key, None)
+
+    @contextmanager
+    def lock(self, key, timeout=LOCK_TIMEOUT, wait=LOCK_WAIT):
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        if not lock.acquire(timeout=wait):
+            raise CacheLockTimeout(key)
+        try:
+            yield
+        finally:
+            lock.release()
+
+
+def create_cache(url: str) -> CacheBackend:
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCache(url)
+    if url.startswith("sqlite:///"):
+        return SQLiteCache(url[len("sqlite:///"):])
+    if url.startswith("memory://"):
+        return MemoryCache()
+    raise ValueError(f"Unsupported CACHE_URL: {url}")
+
+
+cache = create_cache(CACHE_URL)
+
+
+def _fetch_and_store(key: str, ttl: int, fetch: Callable[[], dict]) -> dict:
+    data = fetch()
+    cache.set(key, json.dumps(data).encode(), ttl)
+    return data
+
+
+def get_or_refresh_json(key: str, ttl: int, fetch: Callable[[], dict]) -> dict:
+    """
+    Return the cached JSON value for key, calling fetch() on a miss.
+    Only the worker holding the key's lock refreshes it; the others wait
+    and then read the value it stored. If the wait times out, the waiter
+    checks the cache once more and otherwise fetches without the lock.
+    """
+    cached = cache.get(key)
+    if cached is not None:
+        return json.loads(cached)
+
+    try:
+        with cache.lock(key):
+            cached = cache.get(key)  # another worker may have refreshed it meanwhile
+            if cached is not None:
+                return json.loads(cached)
+            return _fetch_and_store(key, ttl, fetch)
+    except CacheLockTimeout:
+        pass
+
+    cached = cache.get(key)
+    if cached is not None:
+        return json.loads(cached)
+    return _fetch_and_store(key, ttl, fetch)
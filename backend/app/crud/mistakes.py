@@ -1,13 +1,88 @@
+from collections import Counter
+from typing import Iterable, Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
 from app.models.mistake import Mistake
+from app.models.mistake_summary import MistakeSummary
 from app.schemas.mistakes import MistakeCreate
 
+RATING_BUCKET_SIZE = 100
+SUMMARY_DIMENSIONS = ("verdict", "tag", "rating")
+
 def create_mistake(db: Session, mistake: MistakeCreate):
     db_mistake = Mistake(**mistake.dict())
     db.add(db_mistake)
+    add_to_summary(db, [mistake.dict()])
     db.commit()
     db.refresh(db_mistake)
     return db_mistake
 
 def get_mistakes_by_handle(db: Session, handle: str):
-    return db.query(Mistake).filter(Mistake.handle == handle).all()
\ No newline at end of file
+    return db.query(Mistake).filter(Mistake.handle == handle).all()
+
+def rating_bucket(difficulty: Optional[int]) -> str:
+    if not difficulty:
+        return "unrated"
+    return str(difficulty // RATING_BUCKET_SIZE * RATING_BUCKET_SIZE)
+
+def count_summary_buckets(mistakes: Iterable[dict]) -> Counter:
+    """Count (handle, dimension, bucket) keys contributed by the given mistakes."""
+    counts = Counter()
+    for mistake in mistakes:
+        handle = mistake["handle"]
+        counts[(handle, "total", "all")] += 1
+        counts[(handle, "verdict", mistake.get("verdict") or "UNKNOWN")] += 1
+        counts[(handle, "rating", rating_bucket(mistake.get("difficulty")))] += 1
+        for tag in set(mistake.get("tags") or []):
+            counts[(handle, "tag", tag)] += 1
+    return counts
+
+def _write_summary_counts(db: Session, counts: Counter):
+    if not counts:
+        return
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(MistakeSummary)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["handle", "dimension", "bucket"],
+        set_={"count": MistakeSummary.count + stmt.excluded["count"]},
+    )
+    db.execute(stmt, [
+        {"handle": handle, "dimension": dimension, "bucket": bucket, "count": count}
+        for (handle, dimension, bucket), count in counts.items()
+    ])
+
+def add_to_summary(db: Session, mistakes: Iterable[dict]):
+    """
+    Increment the rollup rows for newly inserted mistakes. Does not commit,
+    so the caller's insert and the rollup update land in one transaction.
+    """
+    _write_summary_counts(db, count_summary_buckets(mistakes))
+
+def get_summary(db: Session, handle: str):
+    return db.query(MistakeSummary).filter(MistakeSummary.handle == handle).all()
+
+def rebuild_summary(db: Session, handle: Optional[str] = None, batch_size: int = 1000) -> int:
+    """
+    Recompute rollups from the `mistakes` table (all handles, or one).
+    Rows are streamed and folded into the rollup one batch at a time.
+    Returns the number of mistakes counted.
+    """
+    summaries = db.query(MistakeSummary)
+    mistakes = db.query(Mistake.handle, Mistake.verdict, Mistake.difficulty, Mistake.tags)
+    if handle is not None:
+        summaries = summaries.filter(MistakeSummary.handle == handle)
+        mistakes = mistakes.filter(Mistake.handle == handle)
+    summaries.delete(synchronize_session=False)
+
+    total = 0
+    pending = []
+    for row in mistakes.yield_per(batch_size):
+        pending.append(row._asdict())
+        if len(pending) >= batch_size:
+            add_to_summary(db, pending)
+            total += len(pending)
+            pending = []
+    add_to_summary(db, pending)
+    total += len(pending)
+    db.commit()
+    return total
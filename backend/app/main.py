@@ -1,6 +1,7 @@
 from fastapi import FastAPI
-from app.api import submissions, mistakes, contests
+from app.api import submissions, mistakes, contests, progress, recommend
 from app.core.db import Base, engine
+from app.models import mistake_summary  # registers mistake_summaries for create_all
 from sqlalchemy.exc import OperationalError
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -40,6 +41,8 @@ def on_shutdown():
 app.include_router(submissions.router, prefix="/submissions", tags=["Submissions"])
 app.include_router(mistakes.router, prefix="/mistakes", tags=["Mistakes"])
 app.include_router(contests.app, prefix="/contests", tags=["Contests"])
+app.include_router(progress.router, prefix="/progress", tags=["Progress"])
+app.include_router(recommend.router, prefix="/recommend", tags=["Recommend"])
 
 # Root endpoint
 @app.get("/")
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, UniqueConstraint
+from app.core.db import Base  # the Base init_db creates tables for
+
+class MistakeSummary(Base):
+    """
+    Per-handle mistake counts, maintained on every insert into `mistakes`.
+    dimension is one of "total", "verdict", "tag" or "rating".
+    """
+    __tablename__ = "mistake_summaries"
+    __table_args__ = (
+        UniqueConstraint("handle", "dimension", "bucket", name="uq_mistake_summary_bucket"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    handle = Column(String(100), nullable=False)
+    dimension = Column(String(20), nullable=False)
+    bucket = Column(String, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
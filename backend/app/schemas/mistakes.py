@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 class MistakeBase(BaseModel):
     problem_name: str
@@ -24,4 +24,11 @@ class MistakeResponse(MistakeBase):
     }
 
 class MistakeList(BaseModel):
-    mistakes: List[MistakeBase]
\ No newline at end of file
+    mistakes: List[MistakeBase]
+
+class MistakeSummaryResponse(BaseModel):
+    handle: str
+    total: int
+    verdict: Dict[str, int]
+    tag: Dict[str, int]
+    rating: Dict[str, int]
\ No newline at end of file
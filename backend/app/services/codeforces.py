@@ -1,7 +1,47 @@
 import requests
+from app.core.cache import UPSTREAM_TIMEOUT, get_or_refresh_json
+
+# Seconds an upstream response is shared between workers before refetching
+SUBMISSIONS_TTL = 60
 
 def fetch_last_submissions(handle: str, count: int = 500):
-    url = f"https://codeforces.com/api/user.status?handle={handle}&count={count}"
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
+    def fetch():
+        url = f"https://codeforces.com/api/user.status?handle={handle}&count={count}"
+        response = requests.get(url, timeout=UPSTREAM_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    return get_or_refresh_json(f"cf:user.status:{handle}:{count}", SUBMISSIONS_TTL, fetch)
+
+# Full histories are larger and change less often than the recent window
+HISTORY_TTL = 300
+
+def fetch_all_submissions(handle: str):
+    def fetch():
+        url = f"https://codeforces.com/api/user.status?handle={handle}"
+        response = requests.get(url, timeout=UPSTREAM_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    return get_or_refresh_json(f"cf:user.status:{handle}:all", HISTORY_TTL, fetch)
+
+def fetch_rating_history(handle: str):
+    def fetch():
+        url = f"https://codeforces.com/api/user.rating?handle={handle}"
+        response = requests.get(url, timeout=UPSTREAM_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    return get_or_refresh_json(f"cf:user.rating:{handle}", HISTORY_TTL, fetch)
+
+# The problemset only grows when new rounds are added
+PROBLEMSET_TTL = 6 * 3600
+
+def fetch_problemset():
+    def fetch():
+        url = "https://codeforces.com/api/problemset.problems"
+        response = requests.get(url, timeout=UPSTREAM_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    return get_or_refresh_json("cf:problemset.problems", PROBLEMSET_TTL, fetch)
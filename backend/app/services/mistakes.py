@@ -1,10 +1,183 @@
+import csv
+import io
+import json
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from sqlalchemy import insert, tuple_, update
 from sqlalchemy.orm import Session
+from app.database import SessionLocal
 from app.models.mistake import Mistake
 from app.schemas.mistakes import MistakeCreate
+from app.crud.mistakes import add_to_summary
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet support is optional
+    pa = None
+    pq = None
+
+# Rows fetched per round-trip from the server-side cursor during export
+EXPORT_BATCH_SIZE = 1000
+# Rows sent per bulk INSERT during import
+IMPORT_CHUNK_SIZE = 1000
+
+EXPORT_FIELDS = [
+    "handle",
+    "problem_name",
+    "difficulty",
+    "tags",
+    "verdict",
+    "passedtestcount",
+    "message",
+]
 
 def create_mistake(db: Session, mistake: MistakeCreate):
     db_obj = Mistake(**mistake.dict())  # convert Pydantic -> dict -> model
     db.add(db_obj)
+    add_to_summary(db, [mistake.dict()])
     db.commit()
     db.refresh(db_obj)
     return db_obj
+
+def parquet_available() -> bool:
+    return pq is not None
+
+def _iter_mistake_rows(handle: Optional[str] = None) -> Iterator[dict]:
+    """
+    Yield stored mistakes one dict at a time using a server-side cursor.
+    Opens its own session because streaming outlives the request dependency.
+    """
+    db = SessionLocal()
+    try:
+        query = db.query(*[getattr(Mistake, f) for f in EXPORT_FIELDS])
+        if handle is not None:
+            query = query.filter(Mistake.handle == handle)
+        for row in query.order_by(Mistake.id).yield_per(EXPORT_BATCH_SIZE):
+            yield dict(zip(EXPORT_FIELDS, row))
+    finally:
+        db.close()
+
+def _batched(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def export_ndjson(handle: Optional[str] = None) -> Iterator[bytes]:
+    for row in _iter_mistake_rows(handle):
+        yield (json.dumps(row) + "\n").encode()
+
+def export_csv(handle: Optional[str] = None) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    for batch in _batched(_iter_mistake_rows(handle), EXPORT_BATCH_SIZE):
+        for row in batch:
+            writer.writerow({**row, "tags": json.dumps(row["tags"] or [])})
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+def _parquet_schema():
+    return pa.schema([
+        ("handle", pa.string()),
+        ("problem_name", pa.string()),
+        ("difficulty", pa.int64()),
+        ("tags", pa.list_(pa.string())),
+        ("verdict", pa.string()),
+        ("passedtestcount", pa.int64()),
+        ("message", pa.string()),
+    ])
+
+def export_parquet(handle: Optional[str] = None) -> Iterator[bytes]:
+    """
+    Write one Parquet row group per fetched batch and flush the bytes
+    produced so far, so only a single batch is held in memory.
+    """
+    schema = _parquet_schema()
+    sink = io.BytesIO()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for batch in _batched(_iter_mistake_rows(handle), EXPORT_BATCH_SIZE):
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+    finally:
+        writer.close()
+    yield sink.getvalue()
+
+def _read_ndjson(stream: BinaryIO) -> Iterator[dict]:
+    for line in io.TextIOWrapper(stream, encoding="utf-8"):
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+def _read_csv(stream: BinaryIO) -> Iterator[dict]:
+    for row in csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8", newline="")):
+        row["tags"] = json.loads(row["tags"]) if row.get("tags") else []
+        for field in ("difficulty", "passedtestcount"):
+            row[field] = int(row[field]) if row.get(field) else None
+        yield row
+
+def _read_parquet(stream: BinaryIO) -> Iterator[dict]:
+    parquet_file = pq.ParquetFile(stream)
+    for batch in parquet_file.iter_batches(batch_size=IMPORT_CHUNK_SIZE, columns=EXPORT_FIELDS):
+        yield from batch.to_pylist()
+
+READERS = {
+    "ndjson": _read_ndjson,
+    "csv": _read_csv,
+    "parquet": _read_parquet,
+}
+
+def _mistake_key(mistake: dict) -> tuple:
+    # Same uniqueness rule post_mistake applies
+    return (mistake["handle"], mistake["problem_name"], mistake["verdict"])
+
+def import_mistakes(db: Session, stream: BinaryIO, fmt: str) -> tuple[int, int]:
+    """
+    Validate rows from an uploaded export and upsert them in chunks on
+    (handle, problem_name, verdict), like post_mistake: new rows are bulk
+    inserted and counted in the summary rollup, existing ones only get
+    their message updated. Each chunk is committed on its own, so
+    re-importing or retrying a partial import does not duplicate rows.
+    Returns (inserted, updated).
+    """
+    inserted = updated = 0
+    records = READERS[fmt](stream)
+    for chunk in _batched(records, IMPORT_CHUNK_SIZE):
+        rows = {}
+        for record in chunk:
+            mistake = MistakeCreate(**record).dict()
+            mistake["difficulty"] = mistake["difficulty"] or 0
+            rows[_mistake_key(mistake)] = mistake  # last duplicate in a chunk wins
+
+        existing = (
+            db.query(Mistake.id, Mistake.handle, Mistake.problem_name, Mistake.verdict)
+            .filter(tuple_(Mistake.handle, Mistake.problem_name, Mistake.verdict).in_(list(rows)))
+            .all()
+        )
+        updates = [
+            {"id": row.id, "message": rows[(row.handle, row.problem_name, row.verdict)]["message"]}
+            for row in existing
+        ]
+        existing_keys = {(row.handle, row.problem_name, row.verdict) for row in existing}
+        new_rows = [mistake for key, mistake in rows.items() if key not in existing_keys]
+
+        if updates:
+            db.execute(update(Mistake), updates)
+        if new_rows:
+            db.execute(insert(Mistake), new_rows)
+            add_to_summary(db, new_rows)
+        db.commit()
+        inserted += len(new_rows)
+        updated += len(existing_keys)
+    return inserted, updated
@@ -0,0 +1,90 @@
+import math
+import numpy as np
+import pandas as pd
+from app.utility.cleaner import clean_floats
+
+# pandas period aliases for each supported bucket size
+PERIOD_FREQ = {
+    "day": "D",
+    "week": "W",
+    "month": "M",
+}
+
+def _bucket(seconds: pd.Series, freq: str) -> pd.PeriodIndex:
+    return pd.PeriodIndex(pd.to_datetime(seconds, unit="s"), freq=freq)
+
+def _submission_frame(submissions: list[dict], freq: str) -> pd.DataFrame:
+    df = pd.DataFrame({
+        "time": [sub.get("creationTimeSeconds") for sub in submissions],
+        "verdict": [sub.get("verdict") or "UNKNOWN" for sub in submissions],
+        "problem_rating": [sub.get("problem", {}).get("rating") for sub in submissions],
+    })
+    df["problem_rating"] = pd.to_numeric(df["problem_rating"], errors="coerce")
+    df["accepted"] = df["verdict"].eq("OK")
+    df["bucket"] = _bucket(df["time"], freq)
+    return df
+
+def _rating_series(rating_changes: list[dict], freq: str) -> pd.Series:
+    if not rating_changes:
+        return pd.Series(dtype=float)
+    df = pd.DataFrame({
+        "time": [change["ratingUpdateTimeSeconds"] for change in rating_changes],
+        "rating": [change["newRating"] for change in rating_changes],
+    })
+    df["bucket"] = _bucket(df["time"], freq)
+    return df.sort_values("time").groupby("bucket")["rating"].last().astype(float)
+
+def build_progress(submissions: list[dict], rating_changes: list[dict], period: str, points: int) -> list[dict]:
+    """
+    Bucket a full submission and rating history into per-period totals,
+    then merge neighbouring buckets until at most `points` remain.
+    """
+    freq = PERIOD_FREQ[period]
+    subs = _submission_frame(submissions, freq)
+    rating = _rating_series(rating_changes, freq)
+
+    buckets = subs["bucket"].tolist() + rating.index.tolist()
+    if not buckets:
+        return []
+    index = pd.period_range(min(buckets), max(buckets), freq=freq)
+
+    grouped = subs.groupby("bucket")
+    totals = pd.DataFrame({
+        "attempts": grouped.size(),
+        "accepted": grouped["accepted"].sum(),
+        "rating_sum": grouped["problem_rating"].sum(),
+        "rating_count": grouped["problem_rating"].count(),
+    }).reindex(index, fill_value=0)
+    if subs.empty:
+        # crosstab cannot infer a dtype for an empty period column
+        mistakes = pd.DataFrame(index=index, dtype=int)
+    else:
+        mistakes = (
+            pd.crosstab(subs["bucket"], subs["verdict"])
+            .drop(columns="OK", errors="ignore")
+            .reindex(index, fill_value=0)
+        )
+    user_rating = rating.reindex(index).ffill()
+
+    # Downsample: fold every `step` consecutive buckets into one point
+    step = max(1, math.ceil(len(index) / points))
+    group = np.arange(len(index)) // step
+    totals = totals.groupby(group).sum()
+    mistakes = mistakes.groupby(group).sum()
+    user_rating = user_rating.groupby(group).last()
+    starts = pd.Series(index.start_time).groupby(group).first()
+
+    series = []
+    for i in totals.index:
+        row = totals.loc[i]
+        verdicts = mistakes.loc[i]
+        series.append({
+            "start": starts[i].date().isoformat(),
+            "attempts": int(row["attempts"]),
+            "accepted": int(row["accepted"]),
+            "ac_rate": round(float(row["accepted"] / row["attempts"]), 3) if row["attempts"] else None,
+            "avg_problem_rating": round(float(row["rating_sum"] / row["rating_count"]), 1) if row["rating_count"] else None,
+            "rating": None if pd.isna(user_rating[i]) else int(user_rating[i]),
+            "mistakes": {verdict: int(n) for verdict, n in verdicts.items() if n},
+        })
+    return clean_floats(series)
@@ -0,0 +1,212 @@
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Optional
+import numpy as np
+from app.services.codeforces import (
+    PROBLEMSET_TTL,
+    HISTORY_TTL,
+    fetch_problemset,
+    fetch_all_submissions,
+    fetch_last_submissions,
+    fetch_rating_history,
+)
+
+# Same window the live mistake endpoints look at
+RECENT_WINDOW = 500
+WEAK_TAG_LIMIT = 5
+DEFAULT_RATING = 800
+BAND_BELOW = 100
+BAND_ABOVE = 300
+PROFILE_CACHE_SIZE = 1024
+
+
+class InvalidRatingBand(ValueError):
+    pass
+
+
+class ProblemIndex:
+    """
+    Rated problems sorted by rating, with an inverted index from tag to
+    problem positions. Positions are ascending, so each tag's array is
+    also sorted by rating and a rating band is two binary searches.
+    """
+
+    def __init__(self, problems: list[dict]):
+        rated = sorted((p for p in problems if p.get("rating")), key=lambda p: p["rating"])
+        self.problems = rated
+        self.ratings = np.array([p["rating"] for p in rated], dtype=np.int32)
+        self.position = {(p.get("contestId"), p.get("index")): i for i, p in enumerate(rated)}
+
+        by_tag = defaultdict(list)
+        for i, problem in enumerate(rated):
+            for tag in problem.get("tags", []):
+                by_tag[tag].append(i)
+        self.by_tag = {tag: np.array(positions, dtype=np.int32) for tag, positions in by_tag.items()}
+        self.built_at = time.time()
+
+    def in_band(self, tag: str, low: int, high: int) -> np.ndarray:
+        positions = self.by_tag.get(tag)
+        if positions is None:
+            return np.empty(0, dtype=np.int32)
+        start = np.searchsorted(self.ratings, low, side="left")
+        stop = np.searchsorted(self.ratings, high, side="right")
+        return positions[np.searchsorted(positions, start):np.searchsorted(positions, stop)]
+
+    def solved_bitmap(self, submissions: list[dict]) -> np.ndarray:
+        solved = np.zeros(len(self.problems), dtype=bool)
+        for sub in submissions:
+            if sub.get("verdict") == "OK":
+                problem = sub.get("problem", {})
+                i = self.position.get((problem.get("contestId"), problem.get("index")))
+                if i is not None:
+                    solved[i] = True
+        return solved
+
+
+_index: Optional[ProblemIndex] = None
+_index_lock = threading.Lock()
+# handle -> (index the bitmap was built for, built at, solved bitmap, rating band)
+_profiles: "OrderedDict[str, tuple[ProblemIndex, float, np.ndarray, tuple[int, int]]]" = OrderedDict()
+_profiles_lock = threading.Lock()
+
+
+def get_problem_index() -> ProblemIndex:
+    """Build the index once per worker and rebuild it when the problemset cache expires."""
+    global _index
+    index = _index
+    if index is not None and time.time() - index.built_at < PROBLEMSET_TTL:
+        return index
+    with _index_lock:
+        if _index is None or time.time() - _index.built_at >= PROBLEMSET_TTL:
+            _index = ProblemIndex(fetch_problemset()["result"]["problems"])
+        return _index
+
+
+def get_handle_profile(handle: str, index: ProblemIndex) -> tuple[np.ndarray, tuple[int, int]]:
+    """
+    Return the handle's solved bitmap and default rating band. Both are
+    kept per worker, so the full submission and rating histories are only
+    fetched and decoded on a miss, not on every request.
+    """
+    with _profiles_lock:
+        entry = _profiles.get(handle)
+        if entry is not None and entry[0] is index and time.time() - entry[1] < HISTORY_TTL:
+            _profiles.move_to_end(handle)
+            return entry[2], entry[3]
+
+    submissions = fetch_all_submissions(handle)["result"]
+    solved = index.solved_bitmap(submissions)
+    band = rating_band(fetch_rating_history(handle)["result"], submissions[:RECENT_WINDOW])
+    with _profiles_lock:
+        _profiles[handle] = (index, time.time(), solved, band)
+        _profiles.move_to_end(handle)
+        while len(_profiles) > PROFILE_CACHE_SIZE:
+            _profiles.popitem(last=False)
+    return solved, band
+
+
+def score_weak_tags(stored_tag_counts: dict[str, int], recent: list[dict]) -> list[tuple[str, float]]:
+    """
+    Rank tags by a smoothed failure rate: stored mistakes plus recent
+    non-AC submissions, against recent accepted submissions.
+    """
+    failures = Counter(stored_tag_counts)
+    solves = Counter()
+    for sub in recent:
+        tags = sub.get("problem", {}).get("tags", [])
+        if sub.get("verdict") == "OK":
+            solves.update(tags)
+        else:
+            failures.update(tags)
+
+    scores = {
+        tag: failed / (failed + solves[tag] + 2)
+        for tag, failed in failures.items() if failed
+    }
+    return sorted(scores.items(), key=lambda item: (-item[1], -failures[item[0]]))[:WEAK_TAG_LIMIT]
+
+
+def rating_band(rating_changes: list[dict], recent: list[dict]) -> tuple[int, int]:
+    if rating_changes:
+        rating = rating_changes[-1]["newRating"]
+    else:
+        solved = [s["problem"]["rating"] for s in recent if s.get("verdict") == "OK" and s.get("problem", {}).get("rating")]
+        rating = int(np.median(solved)) if solved else DEFAULT_RATING
+    low = max(DEFAULT_RATING, (rating - BAND_BELOW) // 100 * 100)
+    return low, low + BAND_BELOW + BAND_ABOVE
+
+
+def merge_rating_band(
+    band: tuple[int, int],
+    min_rating: Optional[int] = None,
+    max_rating: Optional[int] = None,
+) -> tuple[int, int]:
+    """
+    Apply caller-supplied bounds to the handle's default band. When only
+    one bound is given and the default edge would land on the wrong side
+    of it, that edge is shifted to keep the default band width.
+    """
+    low, high = band
+    width = high - low
+    if min_rating is not None:
+        low = min_rating
+        if max_rating is None and high < low:
+            high = low + width
+    if max_rating is not None:
+        high = max_rating
+        if min_rating is None and low > high:
+            low = max(0, high - width)
+    if low > high:
+        raise InvalidRatingBand("min_rating must not exceed max_rating")
+    return low, high
+
+
+def recommend(
+    handle: str,
+    stored_tag_counts: dict[str, int],
+    count: int,
+    min_rating: Optional[int] = None,
+    max_rating: Optional[int] = None,
+) -> dict:
+    index = get_problem_index()
+    solved, band = get_handle_profile(handle, index)
+    low, high = merge_rating_band(band, min_rating, max_rating)
+
+    # The same recent window get_mistakes reads, shared through the cache
+    recent = fetch_last_submissions(handle, count=RECENT_WINDOW)["result"]
+    weak_tags = score_weak_tags(stored_tag_counts, recent)
+
+    # Each candidate scores the summed weakness of its matching weak tags
+    bands = [index.in_band(tag, low, high) for tag, _ in weak_tags]
+    if bands:
+        positions = np.concatenate(bands)
+        weights = np.repeat([weakness for _, weakness in weak_tags], [len(b) for b in bands])
+    else:
+        positions, weights = np.empty(0, dtype=np.int32), np.empty(0)
+    candidates, inverse = np.unique(positions, return_inverse=True)
+    scores = np.bincount(inverse, weights=weights, minlength=len(candidates))
+
+    unsolved = ~solved[candidates]
+    candidates, scores = candidates[unsolved], scores[unsolved]
+    order = np.lexsort((candidates, -scores))[:count]
+
+    problems = []
+    for i, score in zip(candidates[order], scores[order]):
+        problem = index.problems[i]
+        problems.append({
+            "contestId": problem.get("contestId"),
+            "index": problem.get("index"),
+            "name": problem.get("name"),
+            "rating": problem.get("rating"),
+            "tags": problem.get("tags", []),
+            "score": round(float(score), 3),
+            "url": f"https://codeforces.com/problemset/problem/{problem.get('contestId')}/{problem.get('index')}",
+        })
+
+    return {
+        "handle": handle,
+        "rating_band": [low, high],
+        "weak_tags": [{"tag": tag, "score": round(score, 3)} for tag, score in weak_tags],
+        "problems": problems,
+    }
@@ -0,0 +1,62 @@
+import os
+import tempfile
+
+import pytest
+
+# Point the app at a throwaway SQLite database and an in-process cache
+# before anything imports app.database / app.core.cache.
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["CACHE_URL"] = "memory://"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from app import database  # noqa: E402
+from app.core import db as core_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import mistake  # noqa: E402,F401  registers the mistakes table
+
+
+def create_tables():
+    database.Base.metadata.create_all(bind=database.engine)
+    core_db.Base.metadata.create_all(bind=core_db.engine)
+
+
+def drop_tables():
+    database.Base.metadata.drop_all(bind=database.engine)
+    core_db.Base.metadata.drop_all(bind=core_db.engine)
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    create_tables()
+    yield
+    drop_tables()
+
+
+@pytest.fixture
+def db():
+    session = database.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def make_mistake(**overrides):
+    mistake = {
+        "problem_name": "Watermelon",
+        "difficulty": 800,
+        "tags": ["math", "brute force"],
+        "verdict": "WRONG_ANSWER",
+        "passedtestcount": 3,
+        "message": "Did not consider n=2",
+        "handle": "tourist",
+    }
+    mistake.update(overrides)
+    return mistake
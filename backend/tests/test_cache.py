@@ -0,0 +1,166 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+import requests
+
+from app.core import cache as cache_module
+from app.core.cache import CacheBackend, CacheLockTimeout, MemoryCache, SQLiteCache, create_cache, get_or_refresh_json
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache()
+    return SQLiteCache(str(tmp_path / "cache.db"))
+
+
+def test_get_set_delete(backend):
+    assert backend.get("k") is None
+    backend.set("k", b"v", ttl=60)
+    assert backend.get("k") == b"v"
+    backend.delete("k")
+    assert backend.get("k") is None
+
+
+def test_entries_expire(backend):
+    backend.set("k", b"v", ttl=0)
+    assert backend.get("k") is None
+
+
+def test_lock_times_out_while_held(backend):
+    with backend.lock("k"):
+        with pytest.raises(CacheLockTimeout):
+            with backend.lock("k", wait=0.1):
+                pass
+
+
+def test_sqlite_locks_are_shared_between_instances(tmp_path):
+    first = SQLiteCache(str(tmp_path / "cache.db"))
+    second = SQLiteCache(str(tmp_path / "cache.db"))
+
+    with first.lock("k"):
+        with pytest.raises(CacheLockTimeout):
+            with second.lock("k", wait=0.1):
+                pass
+    with second.lock("k", wait=0.1):
+        pass
+
+
+def test_incomplete_backend_fails_on_creation():
+    class NoLock(CacheBackend):
+        def get(self, key):
+            return None
+
+        def set(self, key, value, ttl):
+            pass
+
+        def delete(self, key):
+            pass
+
+    with pytest.raises(TypeError):
+        NoLock()
+
+
+def test_create_cache_rejects_unknown_scheme():
+    with pytest.raises(ValueError):
+        create_cache("ftp://example.com")
+
+
+def test_only_one_caller_refreshes(backend, monkeypatch):
+    monkeypatch.setattr(cache_module, "cache", backend)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"status": "OK"}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_or_refresh_json("k", 60, fetch))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"status": "OK"}] * 5
+
+
+class _ContendedCache(MemoryCache):
+    """Every lock attempt times out, as if another worker held it too long."""
+
+    @contextmanager
+    def lock(self, key, timeout=30, wait=35):
+        raise CacheLockTimeout(key)
+        yield
+
+
+def test_lock_timeout_falls_back_to_fetch(monkeypatch):
+    monkeypatch.setattr(cache_module, "cache", _ContendedCache())
+
+    assert get_or_refresh_json("k", 60, lambda: {"status": "OK"}) == {"status": "OK"}
+    assert cache_module.cache.get("k") is not None
+
+
+def test_lock_timeout_rereads_cache(monkeypatch):
+    backend = _ContendedCache()
+    real_get = backend.get
+    reads = []
+
+    def get(key):
+        # The lock holder stores the value while this worker is waiting
+        reads.append(key)
+        if len(reads) == 2:
+            backend.set(key, b'{"status": "OK"}', 60)
+        return real_get(key)
+
+    backend.get = get
+    monkeypatch.setattr(cache_module, "cache", backend)
+
+    def fetch():
+        raise AssertionError("should have used the cached value")
+
+    assert get_or_refresh_json("k", 60, fetch) == {"status": "OK"}
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    monkeypatch.setattr(cache_module, "cache", MemoryCache())
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        if "contest.list" in url:
+            return _FakeResponse({"status": "OK", "result": [{"id": 1234, "name": "Codeforces Round #739 (Div. 2)"}]})
+        return _FakeResponse({"status": "OK", "result": []})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    return calls
+
+
+def test_fetch_last_submissions_uses_shared_cache(upstream):
+    from app.services.codeforces import fetch_last_submissions
+
+    assert fetch_last_submissions("tourist") == fetch_last_submissions("tourist")
+    assert len(upstream) == 1
+
+
+def test_get_contest_id_uses_shared_cache(upstream):
+    from app.api.contests import getContestId
+
+    assert getContestId(739) == 1234
+    assert getContestId(739) == 1234
+    assert len(upstream) == 1
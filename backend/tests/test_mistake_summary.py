@@ -0,0 +1,89 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect
+
+from app.core import db as core_db
+from app.crud import mistakes as crud
+from app.crud.mistakes import rating_bucket, rebuild_summary
+from app.models.mistake import Mistake
+from app.models.mistake_summary import MistakeSummary
+from app.schemas.mistakes import MistakeCreate
+
+from app.main import app
+
+from conftest import make_mistake
+
+
+def test_startup_creates_summary_table():
+    core_db.Base.metadata.drop_all(bind=core_db.engine)
+
+    with TestClient(app):
+        assert "mistake_summaries" in inspect(core_db.engine).get_table_names()
+
+
+def test_rating_bucket():
+    assert rating_bucket(None) == "unrated"
+    assert rating_bucket(0) == "unrated"
+    assert rating_bucket(800) == "800"
+    assert rating_bucket(1450) == "1400"
+
+
+def test_summary_counts_after_post(client):
+    client.post("/mistakes/mistakes", json=make_mistake())
+    client.post("/mistakes/mistakes", json=make_mistake(problem_name="Theatre Square", difficulty=1000, tags=["math"]))
+    client.post("/mistakes/mistakes", json=make_mistake(problem_name="Dragons", verdict="TIME_LIMIT_EXCEEDED", difficulty=None, tags=["greedy"]))
+
+    summary = client.get("/mistakes/summary/tourist").json()
+
+    assert summary == {
+        "handle": "tourist",
+        "total": 3,
+        "verdict": {"WRONG_ANSWER": 2, "TIME_LIMIT_EXCEEDED": 1},
+        "tag": {"math": 2, "brute force": 1, "greedy": 1},
+        "rating": {"800": 1, "1000": 1, "unrated": 1},
+    }
+
+
+def test_updating_message_leaves_counts_unchanged(client):
+    client.post("/mistakes/mistakes", json=make_mistake())
+    client.post("/mistakes/mistakes", json=make_mistake(message="second thoughts"))
+
+    assert client.get("/mistakes/summary/tourist").json()["total"] == 1
+
+
+def test_summary_for_unknown_handle_is_empty(client):
+    summary = client.get("/mistakes/summary/nobody").json()
+
+    assert summary == {"handle": "nobody", "total": 0, "verdict": {}, "tag": {}, "rating": {}}
+
+
+def test_create_mistake_helper_updates_summary(client, db):
+    crud.create_mistake(db, MistakeCreate(**make_mistake()))
+
+    assert client.get("/mistakes/summary/tourist").json()["verdict"] == {"WRONG_ANSWER": 1}
+
+
+def test_rebuild_matches_incremental_counts(client, db):
+    client.post("/mistakes/mistakes", json=make_mistake())
+    client.post("/mistakes/mistakes", json=make_mistake(problem_name="Theatre Square", tags=["math"]))
+    client.post("/mistakes/mistakes", json=make_mistake(handle="petr"))
+    incremental = client.get("/mistakes/summary/tourist").json()
+
+    db.query(MistakeSummary).delete()
+    db.commit()
+    counted = rebuild_summary(db, batch_size=2)
+
+    assert counted == 3
+    assert client.get("/mistakes/summary/tourist").json() == incremental
+    assert client.get("/mistakes/summary/petr").json()["total"] == 1
+
+
+def test_rebuild_single_handle(client, db):
+    client.post("/mistakes/mistakes", json=make_mistake())
+    client.post("/mistakes/mistakes", json=make_mistake(handle="petr"))
+    # Rows inserted behind the rollup's back, e.g. before it existed
+    db.add(Mistake(**make_mistake(problem_name="Dragons")))
+    db.commit()
+
+    assert rebuild_summary(db, "tourist") == 2
+    assert client.get("/mistakes/summary/tourist").json()["total"] == 2
+    assert client.get("/mistakes/summary/petr").json()["total"] == 1
@@ -0,0 +1,84 @@
+import pytest
+
+from app.models.mistake import Mistake
+from conftest import create_tables, drop_tables, make_mistake
+
+FORMATS = ["ndjson", "csv", "parquet"]
+
+
+def _seed(client):
+    client.post("/mistakes/mistakes", json=make_mistake())
+    client.post("/mistakes/mistakes", json=make_mistake(problem_name="Way Too Long Words", difficulty=None, tags=[]))
+    client.post("/mistakes/mistakes", json=make_mistake(handle="petr", verdict="TIME_LIMIT_EXCEEDED"))
+
+
+def _stored(db, handle):
+    return db.query(Mistake).filter(Mistake.handle == handle).order_by(Mistake.id).all()
+
+
+def _export(client, fmt, **params):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    response = client.get("/mistakes/export", params={"format": fmt, **params})
+    assert response.status_code == 200
+    return response.content
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_export_import_round_trip(client, db, fmt):
+    _seed(client)
+    exported = _export(client, fmt, handle="tourist")
+    # Restore into an empty database
+    drop_tables()
+    create_tables()
+
+    response = client.post("/mistakes/import", params={"format": fmt}, files={"file": ("backup", exported)})
+    assert response.json() == {"message": "Success", "imported": 2, "updated": 0}
+
+    stored = _stored(db, "tourist")
+    assert sorted(m.problem_name for m in stored) == ["Watermelon", "Way Too Long Words"]
+    watermelon = next(m for m in stored if m.problem_name == "Watermelon")
+    assert watermelon.tags == ["math", "brute force"]
+    assert watermelon.difficulty == 800
+    assert _stored(db, "petr") == []
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_reimport_does_not_duplicate(client, db, fmt):
+    _seed(client)
+    exported = _export(client, fmt)
+
+    for _ in range(3):
+        response = client.post("/mistakes/import", params={"format": fmt}, files={"file": ("backup", exported)})
+        assert response.json() == {"message": "Success", "imported": 0, "updated": 3}
+
+    assert len(_stored(db, "tourist")) == 2
+    assert client.get("/mistakes/summary/tourist").json()["total"] == 2
+
+
+def test_import_updates_message_of_existing_mistake(client, db):
+    client.post("/mistakes/mistakes", json=make_mistake())
+    body = (
+        b'{"handle": "tourist", "problem_name": "Watermelon", "difficulty": 800, "tags": ["math"],'
+        b' "verdict": "WRONG_ANSWER", "passedtestcount": 3, "message": "edge case n=2"}\n'
+    )
+
+    response = client.post("/mistakes/import", files={"file": ("backup.ndjson", body)})
+
+    assert response.json() == {"message": "Success", "imported": 0, "updated": 1}
+    assert [m.message for m in _stored(db, "tourist")] == ["edge case n=2"]
+
+
+def test_import_rejects_invalid_rows(client):
+    response = client.post("/mistakes/import", files={"file": ("backup.ndjson", b'{"handle": "tourist"}\n')})
+
+    assert response.status_code == 400
+
+
+def test_csv_export_encodes_tags_as_json(client):
+    client.post("/mistakes/mistakes", json=make_mistake())
+
+    lines = _export(client, "csv").decode().splitlines()
+
+    assert lines[0] == "handle,problem_name,difficulty,tags,verdict,passedtestcount,message"
+    assert '"[""math"", ""brute force""]"' in lines[1]
@@ -0,0 +1,77 @@
+import pytest
+
+from app.services.progress import build_progress
+
+DAY = 86400
+# 2024-01-01 00:00:00 UTC, a Monday
+START = 1704067200
+
+
+def _sub(day, verdict="OK", rating=1200):
+    return {"creationTimeSeconds": START + day * DAY, "verdict": verdict, "problem": {"rating": rating}}
+
+
+def _rating(day, new_rating):
+    return {"ratingUpdateTimeSeconds": START + day * DAY, "newRating": new_rating}
+
+
+def test_empty_history():
+    assert build_progress([], [], "week", 10) == []
+
+
+def test_rating_history_only():
+    series = build_progress([], [_rating(0, 1400), _rating(14, 1500)], "week", 10)
+
+    assert [point["start"] for point in series] == ["2024-01-01", "2024-01-08", "2024-01-15"]
+    assert [point["rating"] for point in series] == [1400, 1400, 1500]
+    assert all(point["attempts"] == 0 and point["mistakes"] == {} for point in series)
+    assert all(point["ac_rate"] is None and point["avg_problem_rating"] is None for point in series)
+
+
+@pytest.mark.parametrize("period, starts", [
+    ("day", ["2024-01-01", "2024-01-02", "2024-01-03"]),
+    ("week", ["2024-01-01"]),
+    ("month", ["2024-01-01"]),
+])
+def test_periods(period, starts):
+    submissions = [
+        _sub(0, "WRONG_ANSWER", 1000),
+        _sub(0, "OK", 1000),
+        _sub(2, "TIME_LIMIT_EXCEEDED", None),
+    ]
+
+    series = build_progress(submissions, [], period, 100)
+
+    assert [point["start"] for point in series] == starts
+    assert sum(point["attempts"] for point in series) == 3
+    assert sum(point["accepted"] for point in series) == 1
+    assert series[0]["ac_rate"] == pytest.approx(1 / 2 if period == "day" else 1 / 3, abs=1e-3)
+    assert series[0]["avg_problem_rating"] == 1000.0
+
+
+def test_rating_carries_forward_and_is_null_before_first_contest():
+    series = build_progress([_sub(0), _sub(3)], [_rating(2, 1600)], "day", 100)
+
+    assert [point["rating"] for point in series] == [None, None, 1600, 1600]
+
+
+def test_downsampling_merges_buckets():
+    submissions = [_sub(day, "WRONG_ANSWER" if day % 2 else "OK") for day in range(100)]
+
+    series = build_progress(submissions, [_rating(10, 1300), _rating(60, 1450)], "day", 10)
+
+    assert len(series) == 10
+    assert all(point["attempts"] == 10 for point in series)
+    assert all(point["mistakes"] == {"WRONG_ANSWER": 5} for point in series)
+    assert series[0]["start"] == "2024-01-01"
+    assert series[1]["start"] == "2024-01-11"
+    assert series[0]["rating"] is None
+    assert series[1]["rating"] == 1300
+    assert series[-1]["rating"] == 1450
+
+
+def test_downsampling_never_exceeds_points():
+    submissions = [_sub(day) for day in range(0, 365 * 3, 3)]
+
+    for points in (1, 7, 50):
+        assert len(build_progress(submissions, [], "day", points)) <= points
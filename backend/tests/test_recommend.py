@@ -0,0 +1,151 @@
+from collections import OrderedDict
+
+import pytest
+
+from app.services import recommend as rec
+from app.services.recommend import InvalidRatingBand, ProblemIndex, merge_rating_band, rating_band, score_weak_tags
+
+PROBLEMS = [
+    {"contestId": 1, "index": "A", "name": "Easy DP", "rating": 1200, "tags": ["dp"]},
+    {"contestId": 1, "index": "B", "name": "Mid DP", "rating": 1500, "tags": ["dp", "greedy"]},
+    {"contestId": 2, "index": "A", "name": "Mid Greedy", "rating": 1500, "tags": ["greedy"]},
+    {"contestId": 2, "index": "B", "name": "Hard DP", "rating": 1900, "tags": ["dp", "graphs"]},
+    {"contestId": 3, "index": "A", "name": "Unrated", "tags": ["dp"]},
+    {"contestId": 3, "index": "B", "name": "Mid Graphs", "rating": 1600, "tags": ["graphs", "dp"]},
+]
+
+
+def _sub(problem, verdict):
+    return {"verdict": verdict, "problem": problem}
+
+
+def _names(index, positions):
+    return [index.problems[i]["name"] for i in positions]
+
+
+def test_index_skips_unrated_and_sorts_by_rating():
+    index = ProblemIndex(PROBLEMS)
+
+    assert list(index.ratings) == [1200, 1500, 1500, 1600, 1900]
+    assert "Unrated" not in [p["name"] for p in index.problems]
+
+
+def test_in_band_is_inclusive():
+    index = ProblemIndex(PROBLEMS)
+
+    assert _names(index, index.in_band("dp", 1500, 1900)) == ["Mid DP", "Mid Graphs", "Hard DP"]
+    assert _names(index, index.in_band("dp", 1300, 1400)) == []
+    assert _names(index, index.in_band("greedy", 0, 5000)) == ["Mid DP", "Mid Greedy"]
+    assert _names(index, index.in_band("strings", 0, 5000)) == []
+
+
+def test_solved_bitmap_marks_only_accepted_problems():
+    index = ProblemIndex(PROBLEMS)
+    submissions = [
+        _sub(PROBLEMS[0], "OK"),
+        _sub(PROBLEMS[3], "WRONG_ANSWER"),
+        _sub(PROBLEMS[4], "OK"),  # unrated, not in the index
+        _sub({"contestId": 99, "index": "Z"}, "OK"),
+    ]
+
+    solved = index.solved_bitmap(submissions)
+
+    assert _names(index, solved.nonzero()[0]) == ["Easy DP"]
+
+
+def test_score_weak_tags_combines_stored_and_recent_failures():
+    recent = [
+        _sub(PROBLEMS[0], "WRONG_ANSWER"),
+        _sub(PROBLEMS[2], "OK"),
+        _sub(PROBLEMS[2], "OK"),
+    ]
+
+    scores = dict(score_weak_tags({"graphs": 2}, recent))
+
+    assert scores["dp"] == pytest.approx(1 / 3)
+    assert scores["graphs"] == pytest.approx(2 / 4)
+    assert "greedy" not in scores
+
+
+def test_rating_band():
+    assert rating_band([{"newRating": 1547}], []) == (1400, 1800)
+    assert rating_band([], []) == (800, 1200)
+    assert rating_band([], [_sub(PROBLEMS[3], "OK")]) == (1800, 2200)
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = []
+    submissions = [_sub(PROBLEMS[1], "OK"), _sub(PROBLEMS[3], "WRONG_ANSWER")]
+
+    monkeypatch.setattr(rec, "_index", None)
+    monkeypatch.setattr(rec, "_profiles", OrderedDict())
+    monkeypatch.setattr(rec, "fetch_problemset", lambda: {"result": {"problems": PROBLEMS}})
+    monkeypatch.setattr(rec, "fetch_all_submissions", lambda handle: calls.append("all") or {"result": submissions})
+    monkeypatch.setattr(rec, "fetch_rating_history", lambda handle: calls.append("rating") or {"result": [{"newRating": 1500}]})
+    monkeypatch.setattr(rec, "fetch_last_submissions", lambda handle, count: calls.append("last") or {"result": submissions})
+    return calls
+
+
+def test_recommend_returns_unsolved_problems_in_band(upstream):
+    result = rec.recommend("tourist", {}, count=10)
+
+    assert result["rating_band"] == [1400, 1800]
+    assert [tag["tag"] for tag in result["weak_tags"]] == ["graphs", "dp"]
+    # Mid DP is solved and Hard DP is above the band
+    assert [p["name"] for p in result["problems"]] == ["Mid Graphs"]
+
+
+def test_recommend_reuses_cached_profile(upstream):
+    rec.recommend("tourist", {}, count=10)
+    rec.recommend("tourist", {}, count=10, min_rating=1800, max_rating=2000)
+
+    assert upstream == ["all", "rating", "last", "last"]
+
+
+def test_endpoint_rejects_inverted_rating_range(client):
+    response = client.get("/recommend/tourist", params={"min_rating": 2000, "max_rating": 1000})
+
+    assert response.status_code == 400
+
+
+def test_endpoint_uses_stored_mistakes(client, upstream):
+    from conftest import make_mistake
+
+    client.post("/mistakes/mistakes", json=make_mistake(tags=["greedy"], verdict="TIME_LIMIT_EXCEEDED"))
+
+    response = client.get("/recommend/tourist", params={"min_rating": 1400, "max_rating": 1600})
+
+    assert response.status_code == 200
+    assert "greedy" in [tag["tag"] for tag in response.json()["weak_tags"]]
+    assert [p["name"] for p in response.json()["problems"]] == ["Mid Graphs", "Mid Greedy"]
+
+
+def test_merge_rating_band():
+    assert merge_rating_band((1400, 1800)) == (1400, 1800)
+    assert merge_rating_band((1400, 1800), 1500, 1600) == (1500, 1600)
+    with pytest.raises(InvalidRatingBand):
+        merge_rating_band((1400, 1800), 1600, 1500)
+
+
+def test_single_min_rating_above_default_band(upstream, monkeypatch):
+    monkeypatch.setattr(rec, "fetch_rating_history", lambda handle: {"result": []})
+
+    result = rec.recommend("tourist", {}, count=10, min_rating=2000)
+
+    # Unrated handle defaults to [800, 1200]; the upper edge moves above 2000
+    assert result["rating_band"] == [2000, 2400]
+
+
+def test_single_max_rating_below_default_band(upstream, monkeypatch):
+    monkeypatch.setattr(rec, "fetch_rating_history", lambda handle: {"result": []})
+
+    result = rec.recommend("tourist", {}, count=10, max_rating=700)
+
+    assert result["rating_band"] == [300, 700]
+
+
+def test_single_bound_inside_default_band_keeps_other_edge(upstream):
+    assert rec.recommend("tourist", {}, count=10, min_rating=1500)["rating_band"] == [1500, 1800]
+    rec._profiles.clear()
+    assert rec.recommend("tourist", {}, count=10, max_rating=1600)["rating_band"] == [1400, 1600]